@@ -6,6 +6,77 @@ from bpy.app.handlers import persistent
 #    Helpers: Shared Hide/Restore Logic
 # ------------------------------------------------------------------------
 
+# Mapping: (PropertyGroup Attribute, Overlay Attribute)
+# Module-level constant so the hot path (every G/R/S press and playback
+# start) doesn't rebuild the list on each call.
+_PROPERTIES_TO_CHECK = (
+    ("bones", "show_bones"),
+    ("wireframes", "show_wireframes"),
+    ("outline", "show_outline_selected"),
+    ("extras", "show_extras"),
+    ("origins", "show_object_origins"),
+    ("origins", "show_object_origins_all"),
+    ("face_orientation", "show_face_orientation"),
+    ("text", "show_text"),
+    ("stats", "show_stats"),
+    ("cursor", "show_cursor"),
+    ("relationship_lines", "show_relationship_lines"),
+    ("floor", "show_floor"),
+    ("axes", "show_axis_x"),
+    ("axes", "show_axis_y"),
+    ("axes", "show_axis_z"),
+)
+
+# Property names available on the 3D view overlay type, built lazily
+# from its RNA definition the first time an overlay is seen. Membership
+# here is a single set lookup, where hasattr walks the RNA name table
+# on every call.
+_overlay_prop_names = None
+
+def _overlay_props(overlay):
+    """Returns the cached overlay property-name set, or None if the RNA
+    definition can't be read (callers then fall back to hasattr)."""
+    global _overlay_prop_names
+    if _overlay_prop_names is None:
+        try:
+            _overlay_prop_names = frozenset(overlay.bl_rna.properties.keys())
+        except AttributeError:
+            return None
+    return _overlay_prop_names
+
+# Cached subset of overlay attributes that the CUSTOM strategy should
+# hide. The custom checkboxes change rarely, so this is rebuilt from
+# their update callbacks instead of re-reading all the properties on
+# every keypress. None means the cache is stale and needs a rebuild.
+# The settings are per-scene, so the cache also remembers which scene
+# it was built from and is rebuilt when another scene comes through.
+_active_custom_attrs = None
+_active_custom_scene = None
+
+def _rebuild_active_attrs(props):
+    """Recomputes the list of overlay attributes to hide in CUSTOM mode."""
+    global _active_custom_attrs, _active_custom_scene
+    # Two-arg getattr: these properties are registered by this addon and
+    # always exist on the group, so no default fallback is needed.
+    _active_custom_attrs = [
+        overlay_attr
+        for prop_name, overlay_attr in _PROPERTIES_TO_CHECK
+        if getattr(props, prop_name)
+    ]
+    _active_custom_scene = props.id_data.as_pointer()
+
+@persistent
+def _invalidate_active_attrs(_dummy=None):
+    """Marks the custom-attribute cache stale. Needed after file load
+    and undo/redo, which change the properties without firing their
+    update callbacks."""
+    global _active_custom_attrs
+    _active_custom_attrs = None
+
+def update_custom_attrs(self, context):
+    """Callback for the custom hide checkboxes and the strategy enum."""
+    _rebuild_active_attrs(self)
+
 def apply_hide(scene, overlay):
     """
     Hides overlays based on scene settings.
@@ -14,62 +85,73 @@ def apply_hide(scene, overlay):
     restore_data = {}
     restore_global = False
     props = scene.auto_hide
+    strategy = props.strategy
 
-    if props.strategy == 'ALL':
+    if strategy == 'ALL':
         restore_global = True
         restore_data["show_overlays"] = overlay.show_overlays
         overlay.show_overlays = False
-        
-    elif props.strategy == 'CUSTOM':
+
+    elif strategy == 'CUSTOM':
         restore_global = False
-        
-        # Define mapping: (PropertyGroup Attribute, Overlay Attribute)
-        properties_to_check = [
-            ("bones", "show_bones"),
-            ("wireframes", "show_wireframes"),
-            ("outline", "show_outline_selected"),
-            ("extras", "show_extras"),
-            ("origins", "show_object_origins"),
-            ("origins", "show_object_origins_all"),
-            ("face_orientation", "show_face_orientation"),
-            ("text", "show_text"),
-            ("stats", "show_stats"),
-            ("cursor", "show_cursor"),
-            ("relationship_lines", "show_relationship_lines"),
-            ("floor", "show_floor"),
-            ("axes", "show_axis_x"),
-            ("axes", "show_axis_y"),
-            ("axes", "show_axis_z"),
-        ]
-        
-        for prop_name, overlay_attr in properties_to_check:
-            # If user wants to hide this specific element
-            if getattr(props, prop_name, False):
-                # Check if the overlay has this attribute (safety for different Blender versions/contexts)
-                if hasattr(overlay, overlay_attr):
-                    # Store current state
-                    restore_data[overlay_attr] = getattr(overlay, overlay_attr)
-                    # Turn it off
-                    setattr(overlay, overlay_attr, False)
-                    
+
+        if _active_custom_attrs is None or _active_custom_scene != scene.as_pointer():
+            _rebuild_active_attrs(props)
+
+        # All checkboxes off: nothing to hide, skip the overlay probing
+        if not _active_custom_attrs:
+            return restore_data, False
+
+        known = _overlay_props(overlay)
+        # Local bindings: per-attribute access is LOAD_FAST instead of a
+        # global builtin lookup (overlay has no bulk RNA setter to batch
+        # these writes through)
+        get_value = getattr
+        set_value = setattr
+        for overlay_attr in _active_custom_attrs:
+            # Skip attributes this overlay doesn't have (safety for
+            # different Blender versions/contexts)
+            if known is not None:
+                if overlay_attr not in known:
+                    continue
+            elif not hasattr(overlay, overlay_attr):
+                continue
+            # Store current state
+            restore_data[overlay_attr] = get_value(overlay, overlay_attr)
+            # Turn it off
+            set_value(overlay, overlay_attr, False)
+
     return restore_data, restore_global
 
 def apply_restore(overlay, restore_data, restore_global):
     """
     Restores overlays from the saved data.
+
+    Attributes were validated when apply_hide recorded them, so they are
+    written back directly; Blender raises ReferenceError if the overlay's
+    C data was freed in the meantime (view closed), which just means
+    there is nothing left to restore.
     """
-    if restore_global:
-        if "show_overlays" in restore_data:
-            overlay.show_overlays = restore_data["show_overlays"]
-    else:
-        for attr, val in restore_data.items():
-            if hasattr(overlay, attr):
-                setattr(overlay, attr, val)
+    try:
+        if restore_global:
+            if "show_overlays" in restore_data:
+                overlay.show_overlays = restore_data["show_overlays"]
+        else:
+            set_value = setattr
+            for attr, val in restore_data.items():
+                set_value(overlay, attr, val)
+    except (ReferenceError, RuntimeError):
+        pass
 
 # ------------------------------------------------------------------------
 #    Operator: Auto Hide Overlays Transform Wrapper
 # ------------------------------------------------------------------------
 
+# Shared modal return values. Blender consumes these without mutating
+# them, so reusing one instance avoids a set allocation per event.
+_PASSTHROUGH = {'PASS_THROUGH'}
+_FINISHED_PASSTHROUGH = {'FINISHED', 'PASS_THROUGH'}
+
 class OT_AutoHideTransform(bpy.types.Operator):
     """Hides overlays while transforming, then restores them."""
     bl_idname = "view3d.auto_hide_transform"
@@ -87,49 +169,59 @@ class OT_AutoHideTransform(bpy.types.Operator):
         default='TRANSLATE'
     )
 
+    # Events that confirm or cancel the operation. Class-level frozenset
+    # so modal() doesn't rebuild a set on every event.
+    _FINISH_EVENTS = frozenset({'LEFTMOUSE', 'RIGHTMOUSE', 'ESC', 'RET', 'NUMPAD_ENTER'})
+
+    # Mode -> native transform operator, resolved once at class creation.
+    # The bpy.ops wrappers are stable for the addon's lifetime, so the
+    # per-keypress dispatch is a single dict lookup instead of string
+    # comparisons plus attribute chains.
+    _OPS = {
+        'TRANSLATE': bpy.ops.transform.translate,
+        'ROTATE': bpy.ops.transform.rotate,
+        'RESIZE': bpy.ops.transform.resize,
+    }
+
     # Internal state variables
     _space_data = None
-    _restore_data = {} 
-    _restore_global = False 
+    _restore_data = {}
+    _restore_global = False
     _restore_panel_data = {}
 
     def execute_transform(self):
         """Helper to call the native transform operator."""
         try:
-            if self.mode == 'TRANSLATE':
-                bpy.ops.transform.translate('INVOKE_DEFAULT')
-            elif self.mode == 'ROTATE':
-                bpy.ops.transform.rotate('INVOKE_DEFAULT')
-            elif self.mode == 'RESIZE':
-                bpy.ops.transform.resize('INVOKE_DEFAULT')
+            self._OPS[self.mode]('INVOKE_DEFAULT')
         except RuntimeError as e:
             print(f"Transform Error: {e}")
 
     def modal(self, context, event):
-        # Events that confirm or cancel the operation
-        finish_events = {'LEFTMOUSE', 'RIGHTMOUSE', 'ESC', 'RET', 'NUMPAD_ENTER'}
-        
-        if event.type in finish_events and event.value == 'RELEASE':
-            # Restore the overlay state
-            if self._space_data:
-                overlay = self._space_data.overlay
-                apply_restore(overlay, self._restore_data, self._restore_global)
-                
-                # Restore panels and header
-                if self._restore_panel_data:
-                    try:
-                        if "show_region_ui" in self._restore_panel_data and self._space_data.show_region_ui != self._restore_panel_data["show_region_ui"]:
-                            self._space_data.show_region_ui = self._restore_panel_data["show_region_ui"]
-                        if "show_region_toolbar" in self._restore_panel_data and self._space_data.show_region_toolbar != self._restore_panel_data["show_region_toolbar"]:
-                            self._space_data.show_region_toolbar = self._restore_panel_data["show_region_toolbar"]
-                        if "show_region_header" in self._restore_panel_data and self._space_data.show_region_header != self._restore_panel_data["show_region_header"]:
-                            self._space_data.show_region_header = self._restore_panel_data["show_region_header"]
-                    except (AttributeError, TypeError, ValueError, ReferenceError):
-                        pass
-            
-            return {'FINISHED', 'PASS_THROUGH'}
-        
-        return {'PASS_THROUGH'}
+        # Almost every event during a transform is a mouse move with
+        # value 'NOTHING'; bail out before the membership test.
+        if event.value != 'RELEASE':
+            return _PASSTHROUGH
+        if event.type not in self._FINISH_EVENTS:
+            return _PASSTHROUGH
+
+        # Restore the overlay state
+        if self._space_data:
+            overlay = self._space_data.overlay
+            apply_restore(overlay, self._restore_data, self._restore_global)
+
+            # Restore panels and header
+            if self._restore_panel_data:
+                try:
+                    if "show_region_ui" in self._restore_panel_data and self._space_data.show_region_ui != self._restore_panel_data["show_region_ui"]:
+                        self._space_data.show_region_ui = self._restore_panel_data["show_region_ui"]
+                    if "show_region_toolbar" in self._restore_panel_data and self._space_data.show_region_toolbar != self._restore_panel_data["show_region_toolbar"]:
+                        self._space_data.show_region_toolbar = self._restore_panel_data["show_region_toolbar"]
+                    if "show_region_header" in self._restore_panel_data and self._space_data.show_region_header != self._restore_panel_data["show_region_header"]:
+                        self._space_data.show_region_header = self._restore_panel_data["show_region_header"]
+                except (AttributeError, TypeError, ValueError, ReferenceError):
+                    pass
+
+        return _FINISHED_PASSTHROUGH
 
     def invoke(self, context, event):
         # Reset states for this execution
@@ -139,7 +231,8 @@ class OT_AutoHideTransform(bpy.types.Operator):
 
         # 1. Check if the feature is enabled in the UI
         scene = context.scene
-        if not (scene.auto_hide.overlays or scene.auto_hide.transform_panels or scene.auto_hide.transform_header):
+        props = scene.auto_hide
+        if not (props.overlays or props.transform_panels or props.transform_header):
             # Feature is disabled: Just run the normal transform and exit
             self.execute_transform()
             return {'FINISHED'}
@@ -147,14 +240,14 @@ class OT_AutoHideTransform(bpy.types.Operator):
         # 2. Ensure we are in a 3D View
         if context.space_data.type == 'VIEW_3D':
             self._space_data = context.space_data
-            
+
             # 3. Apply Hide Strategy
-            if scene.auto_hide.overlays:
+            if props.overlays:
                 overlay = self._space_data.overlay
                 self._restore_data, self._restore_global = apply_hide(scene, overlay)
-            
+
             # Apply Panel Hide Strategy
-            if scene.auto_hide.transform_panels:
+            if props.transform_panels:
                 self._restore_panel_data["show_region_ui"] = self._space_data.show_region_ui
                 self._restore_panel_data["show_region_toolbar"] = self._space_data.show_region_toolbar
                 if self._space_data.show_region_ui:
@@ -163,7 +256,7 @@ class OT_AutoHideTransform(bpy.types.Operator):
                     self._space_data.show_region_toolbar = False
 
             # Apply Header Hide Strategy
-            if scene.auto_hide.transform_header:
+            if props.transform_header:
                 self._restore_panel_data["show_region_header"] = self._space_data.show_region_header
                 if self._space_data.show_region_header:
                     self._space_data.show_region_header = False
@@ -172,10 +265,17 @@ class OT_AutoHideTransform(bpy.types.Operator):
             self.report({'WARNING'}, "Not in View3D")
             return {'CANCELLED'}
 
-        # 4. Call the Native Transform Operator
+        # 4. Nothing ended up hidden (e.g. CUSTOM with every checkbox
+        # off): skip the modal handler, which would otherwise run at
+        # mouse-move rate for the whole transform with nothing to restore
+        if not self._restore_data and not self._restore_panel_data:
+            self.execute_transform()
+            return {'FINISHED'}
+
+        # 5. Call the Native Transform Operator
         self.execute_transform()
 
-        # 5. Start our monitoring modal
+        # 6. Start our monitoring modal
         context.window_manager.modal_handler_add(self)
         return {'RUNNING_MODAL'}
 
@@ -183,66 +283,118 @@ class OT_AutoHideTransform(bpy.types.Operator):
 #    Handler: Auto Hide Playback
 # ------------------------------------------------------------------------
 
+class _ViewRecord:
+    """Per-viewport restore state captured when playback hiding starts.
+
+    __slots__ keeps the record compact (one per open 3D view) and makes
+    field access a slot read instead of a dict lookup in the restore loop.
+    """
+    __slots__ = ("space", "overlay", "data", "panel_data")
+
+    def __init__(self, space):
+        self.space = space
+        self.overlay = space.overlay
+        self.data = []
+        self.panel_data = {}
+
 # Global state to track playback hiding
 _playback_state = {
     "active": False,
-    "views": []  # List of dicts with space/overlay details
+    "views": []  # List of _ViewRecord, one per 3D view
 }
 
+# 3D View spaces found on the last walk over all windows and areas,
+# plus a fingerprint of the layout they were collected from. Workspace
+# switches and area splits/joins don't free the old spaces, so staleness
+# can't be detected by ReferenceError alone: _hide_all_views compares
+# the fingerprint and rebuilds on any layout change. None forces a
+# rebuild.
+_cached_view3d_spaces = None
+_cached_layout_sig = None
+
+def _layout_signature():
+    """Cheap fingerprint of the current window/area layout. Changes on
+    workspace switches, area splits/joins and editor type changes."""
+    wm = bpy.context.window_manager
+    if not wm:
+        return ()
+    return tuple(
+        (window.screen.as_pointer(), area.as_pointer(), area.type)
+        for window in wm.windows
+        for area in window.screen.areas
+    )
+
+@persistent
+def _rebuild_view3d_cache(_dummy=None):
+    """Collects every VIEW_3D space across all open windows."""
+    global _cached_view3d_spaces, _cached_layout_sig
+    # Runs on load_post: the loaded file's checkbox state differs from
+    # the cached one, so mark the custom-attribute cache stale as well.
+    _invalidate_active_attrs()
+    spaces = []
+    wm = bpy.context.window_manager
+    if wm:
+        for window in wm.windows:
+            for area in window.screen.areas:
+                if area.type == 'VIEW_3D':
+                    for space in area.spaces:
+                        if space.type == 'VIEW_3D':
+                            spaces.append(space)
+    _cached_view3d_spaces = spaces
+    _cached_layout_sig = _layout_signature()
+
 def _hide_all_views(scene):
-    """Finds all visible 3D views and hides requested elements."""
+    """Hides requested elements on all cached 3D views."""
     global _playback_state
-    
+
     # Avoid double hiding
     if _playback_state["active"]:
         return
 
     _playback_state["active"] = True
     _playback_state["views"] = []
-    
-    wm = bpy.context.window_manager
-    if not wm:
-        return
 
-    hide_overlays = getattr(scene.auto_hide, "playback", False)
-    hide_panels = getattr(scene.auto_hide, "playback_panels", False)
-    hide_header = getattr(scene.auto_hide, "playback_header", False)
-
-    for window in wm.windows:
-        for area in window.screen.areas:
-            if area.type == 'VIEW_3D':
-                for space in area.spaces:
-                    if space.type == 'VIEW_3D':
-                        view_record = {
-                            "space": space,
-                            "overlay": space.overlay,
-                            "data": {},
-                            "global": False,
-                            "panel_data": {}
-                        }
-                        
-                        # Apply Overlay Hide
-                        if hide_overlays:
-                            r_data, r_global = apply_hide(scene, space.overlay)
-                            view_record["data"] = r_data
-                            view_record["global"] = r_global
-                            
-                        # Apply Panel Hide
-                        if hide_panels:
-                            view_record["panel_data"]["show_region_ui"] = space.show_region_ui
-                            view_record["panel_data"]["show_region_toolbar"] = space.show_region_toolbar
-                            if space.show_region_ui:
-                                space.show_region_ui = False
-                            if space.show_region_toolbar:
-                                space.show_region_toolbar = False
-                                
-                        # Apply Header Hide
-                        if hide_header:
-                            view_record["panel_data"]["show_region_header"] = space.show_region_header
-                            if space.show_region_header:
-                                space.show_region_header = False
-                            
-                        _playback_state["views"].append(view_record)
+    if _cached_view3d_spaces is None or _layout_signature() != _cached_layout_sig:
+        _rebuild_view3d_cache()
+
+    # These properties are registered by this addon, so they're always
+    # present on the group; direct access skips getattr's default path.
+    props = scene.auto_hide
+    hide_overlays = props.playback
+    hide_panels = props.playback_panels
+    hide_header = props.playback_header
+
+    for space in _cached_view3d_spaces:
+        try:
+            view_record = _ViewRecord(space)
+
+            # Apply Overlay Hide
+            if hide_overlays:
+                r_data, _r_global = apply_hide(scene, space.overlay)
+                # apply_hide only records attributes that exist
+                # on this overlay, so the pairs can be written
+                # back directly without re-probing on restore.
+                view_record.data = list(r_data.items())
+
+            # Apply Panel Hide
+            if hide_panels:
+                view_record.panel_data["show_region_ui"] = space.show_region_ui
+                view_record.panel_data["show_region_toolbar"] = space.show_region_toolbar
+                if space.show_region_ui:
+                    space.show_region_ui = False
+                if space.show_region_toolbar:
+                    space.show_region_toolbar = False
+
+            # Apply Header Hide
+            if hide_header:
+                view_record.panel_data["show_region_header"] = space.show_region_header
+                if space.show_region_header:
+                    space.show_region_header = False
+        except ReferenceError:
+            # Space was freed since the cache was built (layout changed)
+            continue
+
+        _playback_state["views"].append(view_record)
 
 def _restore_all_views():
     """Restores overlays and panels on all tracked views."""
@@ -252,17 +404,19 @@ def _restore_all_views():
         return
         
     for view_record in _playback_state["views"]:
-        # 1. Restore Overlays
-        overlay = view_record["overlay"]
+        # 1. Restore Overlays (pairs were validated at hide time)
+        overlay = view_record.overlay
         try:
-            if view_record["data"] or view_record["global"]:
-                apply_restore(overlay, view_record["data"], view_record["global"])
-        except (AttributeError, TypeError, ValueError, ReferenceError):
-            pass 
-            
+            set_value = setattr
+            for attr, val in view_record.data:
+                set_value(overlay, attr, val)
+        except (ReferenceError, RuntimeError):
+            # The view was closed while playback was running
+            pass
+
         # 2. Restore Panels
-        space = view_record.get("space")
-        panel_data = view_record.get("panel_data", {})
+        space = view_record.space
+        panel_data = view_record.panel_data
         if space and panel_data:
             try:
                 if "show_region_ui" in panel_data and space.show_region_ui != panel_data["show_region_ui"]:
@@ -281,9 +435,13 @@ def _restore_all_views():
 @persistent
 def on_playback_start(scene):
     """Handler called when animation playback starts."""
-    target_scene = scene if isinstance(scene, bpy.types.Scene) else bpy.context.scene
+    # Blender passes the playing Scene here (None in some edge versions),
+    # so a truthiness check is enough.
+    target_scene = scene or bpy.context.scene
+    if not target_scene:
+        return
     auto_hide = target_scene.auto_hide
-    
+
     if auto_hide.playback or auto_hide.playback_panels or auto_hide.playback_header:
         _hide_all_views(target_scene)
 
@@ -355,21 +513,22 @@ class AutoHideProperties(bpy.types.PropertyGroup):
             ('ALL', "Hide All", "Hide all overlays globally"),
             ('CUSTOM', "Custom", "Hide specific overlay elements"),
         ],
-        default='ALL'
+        default='ALL',
+        update=update_custom_attrs
     )
-    
-    bones: bpy.props.BoolProperty(name="Hide Bones", default=True)
-    wireframes: bpy.props.BoolProperty(name="Hide Wireframes", default=True)
-    outline: bpy.props.BoolProperty(name="Hide Outline", default=True)
-    extras: bpy.props.BoolProperty(name="Hide Extras", default=True)
-    origins: bpy.props.BoolProperty(name="Hide Origins", default=True)
-    face_orientation: bpy.props.BoolProperty(name="Hide Face Orientation", default=True)
-    text: bpy.props.BoolProperty(name="Hide Text", default=True)
-    stats: bpy.props.BoolProperty(name="Hide Statistics", default=True)
-    cursor: bpy.props.BoolProperty(name="Hide Cursor", default=True)
-    relationship_lines: bpy.props.BoolProperty(name="Hide Relationships", default=True)
-    floor: bpy.props.BoolProperty(name="Hide Grid Floor", default=True)
-    axes: bpy.props.BoolProperty(name="Hide Axes", default=True)
+
+    bones: bpy.props.BoolProperty(name="Hide Bones", default=True, update=update_custom_attrs)
+    wireframes: bpy.props.BoolProperty(name="Hide Wireframes", default=True, update=update_custom_attrs)
+    outline: bpy.props.BoolProperty(name="Hide Outline", default=True, update=update_custom_attrs)
+    extras: bpy.props.BoolProperty(name="Hide Extras", default=True, update=update_custom_attrs)
+    origins: bpy.props.BoolProperty(name="Hide Origins", default=True, update=update_custom_attrs)
+    face_orientation: bpy.props.BoolProperty(name="Hide Face Orientation", default=True, update=update_custom_attrs)
+    text: bpy.props.BoolProperty(name="Hide Text", default=True, update=update_custom_attrs)
+    stats: bpy.props.BoolProperty(name="Hide Statistics", default=True, update=update_custom_attrs)
+    cursor: bpy.props.BoolProperty(name="Hide Cursor", default=True, update=update_custom_attrs)
+    relationship_lines: bpy.props.BoolProperty(name="Hide Relationships", default=True, update=update_custom_attrs)
+    floor: bpy.props.BoolProperty(name="Hide Grid Floor", default=True, update=update_custom_attrs)
+    axes: bpy.props.BoolProperty(name="Hide Axes", default=True, update=update_custom_attrs)
 
 # ------------------------------------------------------------------------
 #    Addon Preferences
@@ -451,29 +610,35 @@ def draw_overlay_menu(self, context):
     col.prop(props, "playback_panels", text="Hide Sidebar/Toolbar")
     col.prop(props, "playback_header", text="Hide Header")
     
-    # Granular Options (if either overlay auto-hiding is enabled)
-    if props.overlays or props.playback:
-        col.separator()
-        col = layout.column(align=True)
-        # Strategy Selector
-        col.row().prop(props, "strategy", expand=True)
-        
-        # Custom Checkboxes
-        if props.strategy == 'CUSTOM':
-            box = col.box()
-            col_box = box.column(align=True)
-            col_box.prop(props, "bones", text="Bones")
-            col_box.prop(props, "wireframes", text="Wireframes")
-            col_box.prop(props, "outline", text="Outline")
-            col_box.prop(props, "extras", text="Extras")
-            col_box.prop(props, "origins", text="Origins")
-            col_box.prop(props, "face_orientation", text="Face Orientation")
-            col_box.prop(props, "relationship_lines", text="Relationships")
-            col_box.prop(props, "text", text="Text Info")
-            col_box.prop(props, "stats", text="Statistics")
-            col_box.prop(props, "cursor", text="3D Cursor")
-            col_box.prop(props, "floor", text="Grid Floor")
-            col_box.prop(props, "axes", text="Axes")
+    # Granular Options (only if either overlay auto-hiding is enabled).
+    # This runs on every redraw of the Overlay popover, so bail out as
+    # soon as there is nothing more to draw.
+    if not (props.overlays or props.playback):
+        return
+
+    col.separator()
+    col = layout.column(align=True)
+    # Strategy Selector
+    col.row().prop(props, "strategy", expand=True)
+
+    # Custom Checkboxes
+    if props.strategy != 'CUSTOM':
+        return
+
+    box = col.box()
+    col_box = box.column(align=True)
+    col_box.prop(props, "bones", text="Bones")
+    col_box.prop(props, "wireframes", text="Wireframes")
+    col_box.prop(props, "outline", text="Outline")
+    col_box.prop(props, "extras", text="Extras")
+    col_box.prop(props, "origins", text="Origins")
+    col_box.prop(props, "face_orientation", text="Face Orientation")
+    col_box.prop(props, "relationship_lines", text="Relationships")
+    col_box.prop(props, "text", text="Text Info")
+    col_box.prop(props, "stats", text="Statistics")
+    col_box.prop(props, "cursor", text="3D Cursor")
+    col_box.prop(props, "floor", text="Grid Floor")
+    col_box.prop(props, "axes", text="Axes")
 
 # ------------------------------------------------------------------------
 #    Keymap Registration
@@ -517,7 +682,13 @@ def unregister_keymaps():
 #    Registration
 # ------------------------------------------------------------------------
 
+# Whether our bpy.app.handlers entries are currently installed; avoids
+# scanning the handler lists on unregister.
+_handlers_installed = False
+
 def register():
+    global _handlers_installed
+
     # Classes
     bpy.utils.register_class(OT_AutoHideTransform)
     bpy.utils.register_class(AutoHideProperties)
@@ -532,17 +703,35 @@ def register():
     # Register Playback Handlers
     bpy.app.handlers.animation_playback_pre.append(on_playback_start)
     bpy.app.handlers.animation_playback_post.append(on_playback_stop)
-    
+    bpy.app.handlers.load_post.append(_rebuild_view3d_cache)
+    bpy.app.handlers.undo_post.append(_invalidate_active_attrs)
+    bpy.app.handlers.redo_post.append(_invalidate_active_attrs)
+    _handlers_installed = True
+
     register_keymaps()
 
+    # Prime the custom-attribute cache (context can be restricted while
+    # the addon is being enabled, so fall back to the lazy rebuild).
+    scene = getattr(bpy.context, "scene", None)
+    if scene is not None:
+        _rebuild_active_attrs(scene.auto_hide)
+
 def unregister():
+    global _handlers_installed
+
     unregister_keymaps()
-    
+
     # Remove Handlers
-    if on_playback_start in bpy.app.handlers.animation_playback_pre:
-        bpy.app.handlers.animation_playback_pre.remove(on_playback_start)
-    if on_playback_stop in bpy.app.handlers.animation_playback_post:
-        bpy.app.handlers.animation_playback_post.remove(on_playback_stop)
+    if _handlers_installed:
+        try:
+            bpy.app.handlers.animation_playback_pre.remove(on_playback_start)
+            bpy.app.handlers.animation_playback_post.remove(on_playback_stop)
+            bpy.app.handlers.load_post.remove(_rebuild_view3d_cache)
+            bpy.app.handlers.undo_post.remove(_invalidate_active_attrs)
+            bpy.app.handlers.redo_post.remove(_invalidate_active_attrs)
+        except ValueError:
+            pass
+        _handlers_installed = False
     
     # Remove UI
     bpy.types.VIEW3D_PT_overlay.remove(draw_overlay_menu)